@@ -41,6 +41,11 @@ def test_NRTL_gammas():
     gammas = NRTL_gammas([0.252, 0.748], [[0, -0.178], [1.963, 0]], [[0, 0.2974],[.2974, 0]])
     assert_close1d(gammas, [1.9363183763514304, 1.1537609663170014])
 
+    # Reusing precomputed Gs
+    Gs = [[1.0, exp(0.2974*0.178)], [exp(-0.2974*1.963), 1.0]]
+    gammas = NRTL_gammas([0.252, 0.748], [[0, -0.178], [1.963, 0]], [[0, 0.2974],[.2974, 0]], Gs=Gs)
+    assert_close1d(gammas, [1.9363183763514304, 1.1537609663170014], rtol=1e-14)
+
     # Test the general form against the simpler binary form
     def NRTL2(xs, taus, alpha):
         x1, x2 = xs
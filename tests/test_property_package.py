@@ -26,11 +26,13 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
+import thermo.property_package
 from thermo.chemical import Chemical
 from thermo.eos import *
 from thermo.eos_mix import *
 from thermo.mixture import Mixture
 from thermo.property_package import *
+from thermo.property_package import Rachford_Rice_Halley, Rachford_Rice_solution_negative
 
 
 @pytest.mark.deprecated
@@ -650,3 +652,77 @@ def test_PartialPropertyIdeal():
     assert_allclose(a, -118882.74138254928, rtol=5e-3)
 
 
+def _Rachford_Rice_err(zs, Ks, V_over_F):
+    return sum(zi*(Ki - 1.0)/(1.0 + V_over_F*(Ki - 1.0)) for zi, Ki in zip(zs, Ks))
+
+
+def test_Rachford_Rice_solution_negative():
+    # Negative compositions; the error has a pole inside the usual bounds
+    zs = [0.376, -0.257, -0.193, 0.577, 0.042, 0.455]
+    Ks = [0.754, 0.171, 24.7, 2.88, 2.05, 3.88]
+    V_over_F, xs, ys = Rachford_Rice_solution_negative(zs, Ks)
+    assert_allclose(V_over_F, 0.0397874302357603, rtol=1e-9)
+    assert abs(_Rachford_Rice_err(zs, Ks, V_over_F)) < 1e-12
+    assert_allclose(ys, [Ki*xi for Ki, xi in zip(Ks, xs)], rtol=1e-13)
+
+
+def test_Rachford_Rice_solution_negative_fallback(monkeypatch):
+    def fail(*args, **kwargs):
+        raise ValueError
+    # Make the fallback solvers run instead of flash_inner_loop
+    monkeypatch.setattr(thermo.property_package, 'flash_inner_loop', fail)
+
+    # Positive compositions, solved with the bracketed Halley iteration
+    zs = [0.5, 0.3, 0.2]
+    Ks = [1.685, 0.742, 0.532]
+    V_over_F, xs, ys = Rachford_Rice_solution_negative(zs, Ks)
+    assert_allclose(V_over_F, 0.6907302627738542, rtol=1e-9)
+    assert abs(_Rachford_Rice_err(zs, Ks, V_over_F)) < 1e-12
+
+    # Negative compositions must not converge onto a pole of the error
+    zs = [0.376, -0.257, -0.193, 0.577, 0.042, 0.455]
+    Ks = [0.754, 0.171, 24.7, 2.88, 2.05, 3.88]
+    V_over_F, xs, ys = Rachford_Rice_solution_negative(zs, Ks)
+    assert_allclose(V_over_F, 0.0397874302357603, rtol=1e-9)
+    assert abs(_Rachford_Rice_err(zs, Ks, V_over_F)) < 1e-12
+
+    # Binary closed form
+    V_over_F, xs, ys = Rachford_Rice_solution_negative([0.5, 0.5], [2.0, 0.5])
+    assert_allclose(V_over_F, 0.5, rtol=1e-13)
+    assert_allclose(xs, [1.0/3.0, 2.0/3.0], rtol=1e-13)
+    assert_allclose(ys, [2.0/3.0, 1.0/3.0], rtol=1e-13)
+
+    V_over_F, xs, ys = Rachford_Rice_solution_negative([1.2, -0.2], [2.0, 0.5])
+    assert_allclose(V_over_F, 2.6, rtol=1e-13)
+    assert abs(_Rachford_Rice_err([1.2, -0.2], [2.0, 0.5], V_over_F)) < 1e-13
+
+
+
+def test_Rachford_Rice_solution_negative_unbracketed(monkeypatch):
+    def fail(*args, **kwargs):
+        raise ValueError
+    monkeypatch.setattr(thermo.property_package, 'flash_inner_loop', fail)
+    # Negative compositions which Halley's method without a bracket either
+    # failed on (NotBoundedError) or solved to a different root than the
+    # secant iteration
+    cases = [([0.8179, -0.1687, -0.2665, -0.4537, -0.1463, -0.3730],
+              [4.2456, 15.4207, 0.1161, 2.2318, 0.8027, 2.9257], 0.055052157762237),
+             ([-0.4838, -0.1122, -0.0865, 0.0113, 0.3107, 0.1235],
+              [2.003, 13.0606, 0.1775, 1.2908, 4.0892, 2.3634], 0.17874143109413296),
+             ([0.4786, -0.0032, -0.3417, -0.1168],
+              [0.9365, 10.1112, 0.1116, 3.5817], 0.04991174351755613),
+             ([0.7587, -0.0094, 0.0256], [1.054, 5.7522, 0.4978], 1.185469245041661),
+             ([-0.2717, 0.8587, -0.436, 0.8245, -0.4755, 0.964],
+              [28.0594, 0.1566, 11.813, 0.3933, 0.2099, 12.5012], 0.09591649973429207)]
+    for zs, Ks, V_over_F_expect in cases:
+        V_over_F, xs, ys = Rachford_Rice_solution_negative(zs, Ks)
+        assert_allclose(V_over_F, V_over_F_expect, rtol=1e-9)
+        assert abs(_Rachford_Rice_err(zs, Ks, V_over_F)) < 1e-12
+
+def test_Rachford_Rice_Halley_zero_denominators():
+    # numpy floats would otherwise give inf/nan and a RuntimeWarning
+    K_minus_1 = np.array([1.0, -0.5])
+    with pytest.raises(ZeroDivisionError):
+        Rachford_Rice_Halley(K_minus_1, 0.5*K_minus_1, np.float64(2.0))
+    with pytest.raises(ZeroDivisionError):
+        Rachford_Rice_Halley(np.zeros(2), np.zeros(2), np.float64(0.3))
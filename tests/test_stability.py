@@ -68,3 +68,10 @@ def test_guesses_bad_ranges():
     stab = StabilityTester(Tcs=[647.086, 514.7], Pcs=[22048320.0, 6137000.0], omegas=[0.344, 0.635], aqueous_check=True, CASs=['7732-18-5', '64-17-5'])
     guesses = list(stab.incipient_guesses(T=6.2, P=5e4, zs=[.4, .6]))
     assert all(not isinf(x) and not isnan(x) for r in guesses for x in r)
+
+
+def test_StabilityTester_no_Wilson_constants():
+    # Missing Pcs/omegas only matter once Wilson guesses are requested
+    stab = StabilityTester(Tcs=[647.086, 514.7], Pcs=[None, 0.0], omegas=[None, 0.635])
+    guesses = stab.pure_guesses()
+    assert_close1d(guesses[0], [0.999999000001, 9.99999000001e-07])
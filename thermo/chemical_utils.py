@@ -171,6 +171,9 @@ standard_state_transitions = {
 shomate_gas_elements = ('H', 'O', 'N', 'F', 'P', 'Cl', 'Br', 'I', 'Mg', 'B', 'Pb', 'Li', 'Na', 'Al', 'K', 'V', 'Cr')
 standard_state_supported_elements = shomate_gas_elements + ('C', 'Si', 'Hg')
 standard_state_supported_elements_set = set(standard_state_supported_elements)
+# Elements whose reference state is a single solid or liquid phase at every T
+standard_state_solid_elements = frozenset(['C'])
+standard_state_liquid_elements = frozenset([''])
 
 element_HeatCapacityGas_dict = {}
 
@@ -202,6 +205,33 @@ def element_HeatCapacitySolid_cache(CAS):
         element_HeatCapacitySolid_dict[CAS] = obj
         return obj
 
+standard_state_element_objs_dict = {}
+
+def standard_state_element_objs_cache(ele):
+    # Resolve the periodic table entry and the solid, liquid, and gas heat
+    # capacity objects of an element once; reused for every temperature
+    try:
+        return standard_state_element_objs_dict[ele]
+    except:
+        CAS = periodic_table[ele].CAS_standard
+        solid_obj = element_HeatCapacitySolid_cache(CAS)
+        liquid_obj = element_HeatCapacityLiquid_cache(CAS)
+        gas_obj = element_HeatCapacityGas_cache(CAS)
+        # Select the methods once; setting a method clears the property's cache
+        if ele in shomate_gas_elements:
+            gas_obj.method = 'WEBBOOK_SHOMATE'
+            if 'WEBBOOK_SHOMATE' in liquid_obj.all_methods:
+                liquid_obj.method = 'WEBBOOK_SHOMATE'
+            if 'WEBBOOK_SHOMATE' in solid_obj.all_methods:
+                solid_obj.method = 'WEBBOOK_SHOMATE'
+        elif ele == 'Si':
+            solid_obj.method = 'JANAF_FIT'
+            liquid_obj.method = 'JANAF_FIT'
+            gas_obj.method = 'JANAF_FIT'
+        objs = (solid_obj, liquid_obj, gas_obj)
+        standard_state_element_objs_dict[ele] = objs
+        return objs
+
 
 def standard_state_ideal_gas_formation(c, T, Hf=None, Sf=None, T_ref=298.15):
     r'''This function calculates the standard state ideal-gas heat of formation
@@ -267,18 +297,23 @@ _standard_formation_reaction_cache = {}
 MAX_STANDARD_FORMATION_CACHE = 250
 def _standard_state_ideal_gas_formation_direct(T, Hf_ref, Sf_ref, atoms, gas_Cp, T_ref=298.15, cache=True):
     if cache:
-        atoms_key = hash(tuple(atoms.items()))
+        atoms_key = tuple(atoms.items())
         if atoms_key in _standard_formation_reaction_cache:
-            reactant_coeff, elemental_counts, elemental_composition = _standard_formation_reaction_cache[atoms_key]
+            # Move the entry to the end so the least recently used one is evicted first
+            cached = _standard_formation_reaction_cache[atoms_key] = _standard_formation_reaction_cache.pop(atoms_key)
+            reactant_coeff, elemental_counts, elements = cached
         else:
             reactant_coeff, elemental_counts, elemental_composition = standard_formation_reaction(atoms)
-            _standard_formation_reaction_cache[atoms_key] = reactant_coeff, elemental_counts, elemental_composition
+            # Each element's composition dict has a single key, its symbol
+            elements = [next(iter(ele_data)) for ele_data in elemental_composition]
+            _standard_formation_reaction_cache[atoms_key] = reactant_coeff, elemental_counts, elements
 
             if len(_standard_formation_reaction_cache) > MAX_STANDARD_FORMATION_CACHE:
                 # Prevent the cache growing too much
                 _standard_formation_reaction_cache.pop(next(iter(_standard_formation_reaction_cache)))
     else:
-        _standard_formation_reaction_cache[atoms_key] = reactant_coeff, elemental_counts, elemental_composition
+        reactant_coeff, elemental_counts, elemental_composition = standard_formation_reaction(atoms)
+        elements = [next(iter(ele_data)) for ele_data in elemental_composition]
 
     dH_compound = gas_Cp.T_dependent_property_integral(T_ref, T)
     dS_compound = gas_Cp.T_dependent_property_integral_over_T(T_ref, T)
@@ -287,30 +322,11 @@ def _standard_state_ideal_gas_formation_direct(T, Hf_ref, Sf_ref, atoms, gas_Cp,
     S_calc = reactant_coeff*Sf_ref + reactant_coeff*dS_compound
     # if the compound is an element it will need special handling to go from solid liquid to gas if needed
 
-    solid_ele = set(['C'])
-    liquid_ele = set([''])
-    
-    for coeff, ele_data in zip(elemental_counts, elemental_composition):
-        ele = list(ele_data.keys())[0]
-        element_obj = periodic_table[ele]
-#         element = Chemical(element_obj.CAS_standard)
-        solid_obj = element_HeatCapacitySolid_cache(element_obj.CAS_standard)
-        liquid_obj = element_HeatCapacityLiquid_cache(element_obj.CAS_standard)
-        gas_obj = element_HeatCapacityGas_cache(element_obj.CAS_standard)
+    for coeff, ele in zip(elemental_counts, elements):
+        solid_obj, liquid_obj, gas_obj = standard_state_element_objs_cache(ele)
         if ele not in standard_state_supported_elements_set:
             raise NotImplementedError(f"The element {ele} is not currently supported")
 
-        if ele in shomate_gas_elements:
-            gas_obj.method = 'WEBBOOK_SHOMATE'
-            if 'WEBBOOK_SHOMATE' in liquid_obj.all_methods:
-                liquid_obj.method = 'WEBBOOK_SHOMATE'
-            if 'WEBBOOK_SHOMATE' in solid_obj.all_methods:
-                solid_obj.method = 'WEBBOOK_SHOMATE'
-        elif ele == 'Si':
-            solid_obj.method = 'JANAF_FIT'
-            liquid_obj.method = 'JANAF_FIT'
-            gas_obj.method = 'JANAF_FIT'
-
         if ele in standard_state_transitions:
             dat = standard_state_transitions[ele]
             Tm = dat['Tm']
@@ -377,10 +393,10 @@ def _standard_state_ideal_gas_formation_direct(T, Hf_ref, Sf_ref, atoms, gas_Cp,
         # https://janaf.nist.gov/tables/Cu-001.html
         # https://janaf.nist.gov/tables/Zn-001.html
 
-        elif ele in solid_ele:
+        elif ele in standard_state_solid_elements:
             dH_ele = solid_obj.T_dependent_property_integral(T_ref, T)
             dS_ele = solid_obj.T_dependent_property_integral_over_T(T_ref, T)
-        elif ele in liquid_ele:
+        elif ele in standard_state_liquid_elements:
             dH_ele = liquid_obj.T_dependent_property_integral(T_ref, T)
             dS_ele = liquid_obj.T_dependent_property_integral_over_T(T_ref, T)
         else:
@@ -473,9 +473,8 @@ class HeatCapacityGas(TDependentProperty):
             else:
                 return CoolProp_T_dependent_property(T, self.CASRN, 'CP0MOLAR', 'g')
         elif method == POLING_POLY:
-            Cp = R*(self.POLING_coefs[0] + self.POLING_coefs[1]*T
-            + self.POLING_coefs[2]*T**2 + self.POLING_coefs[3]*T**3
-            + self.POLING_coefs[4]*T**4)
+            coeffs = self.POLING_coefs
+            Cp = R*(coeffs[0] + T*(coeffs[1] + T*(coeffs[2] + T*(coeffs[3] + T*coeffs[4]))))
         elif method == POLING_CONST:
             Cp = self.POLING_constant
         elif method == CRCSTD:
@@ -1367,8 +1366,8 @@ class HeatCapacitySolid(TDependentProperty):
             Heat capacity of the solid at T, [J/mol/K]
         '''
         if method == PERRY151:
-            Cp = (self.PERRY151_const + self.PERRY151_lin*T
-            + self.PERRY151_quadinv/T**2 + self.PERRY151_quad*T**2)*calorie
+            Cp = (self.PERRY151_const + T*(self.PERRY151_lin + self.PERRY151_quad*T)
+            + self.PERRY151_quadinv/(T*T))*calorie
         elif method == CRCSTD:
             Cp = self.CRCSTD_Cp
         elif method == LASTOVKA_S:
@@ -1440,10 +1439,9 @@ class HeatCapacitySolid(TDependentProperty):
             [`units*K`]
         '''
         if method == PERRY151:
-            H2 = (self.PERRY151_const*T2 + 0.5*self.PERRY151_lin*T2**2
-                  - self.PERRY151_quadinv/T2 + self.PERRY151_quad*T2**3/3.)
-            H1 = (self.PERRY151_const*T1 + 0.5*self.PERRY151_lin*T1**2
-                  - self.PERRY151_quadinv/T1 + self.PERRY151_quad*T1**3/3.)
+            const, lin, quad = self.PERRY151_const, 0.5*self.PERRY151_lin, self.PERRY151_quad*(1.0/3.0)
+            H2 = T2*(const + T2*(lin + quad*T2)) - self.PERRY151_quadinv/T2
+            H1 = T1*(const + T1*(lin + quad*T1)) - self.PERRY151_quadinv/T1
             return (H2-H1)*calorie
         elif method == CRCSTD:
             return (T2-T1)*self.CRCSTD_Cp
@@ -1477,10 +1475,11 @@ class HeatCapacitySolid(TDependentProperty):
             [`units`]
         '''
         if method == PERRY151:
-            S2 = (self.PERRY151_const*log(T2) + self.PERRY151_lin*T2
-                  - self.PERRY151_quadinv/(2.*T2**2) + 0.5*self.PERRY151_quad*T2**2)
-            S1 = (self.PERRY151_const*log(T1) + self.PERRY151_lin*T1
-                  - self.PERRY151_quadinv/(2.*T1**2) + 0.5*self.PERRY151_quad*T1**2)
+            lin, quad, quadinv = self.PERRY151_lin, 0.5*self.PERRY151_quad, 0.5*self.PERRY151_quadinv
+            S2 = (self.PERRY151_const*log(T2) + T2*(lin + quad*T2)
+                  - quadinv/(T2*T2))
+            S1 = (self.PERRY151_const*log(T1) + T1*(lin + quad*T1)
+                  - quadinv/(T1*T1))
             return (S2 - S1)*calorie
         elif method == CRCSTD:
             S2 = self.CRCSTD_Cp*log(T2)
@@ -60,6 +60,7 @@ __all__ = ['NRTL', 'NRTL_gammas', 'NRTL_gammas_binaries', 'NRTL_gammas_binaries_
 
 try:
     array, zeros, ones, delete, npsum, nplog, nptranspose, ascontiguousarray = np.array, np.zeros, np.ones, np.delete, np.sum, np.log, np.transpose, np.ascontiguousarray
+    npexp, dot = np.exp, np.dot
 except (ImportError, AttributeError):
     pass
 
@@ -105,9 +106,7 @@ def nrtl_taus(T, N, A, B, E, F, G, H, taus=None):
         taus = [[0.0]*N for _ in range(N)] # numba: delete
 #        taus = zeros((N, N)) # numba: uncomment
 
-    T2 = T*T
     Tinv = 1.0/T
-    T2inv = Tinv*Tinv
     logT = log(T)
     for i in range(N):
         Ai = A[i]
@@ -118,9 +117,9 @@ def nrtl_taus(T, N, A, B, E, F, G, H, taus=None):
         Hi = H[i]
         tausi = taus[i]
         for j in range(N):
-            tausi[j] = (Ai[j] + Bi[j]*Tinv + Ei[j]*logT
-                            + Fi[j]*T + Gi[j]*T2inv
-                            + Hi[j]*T2)
+            # Horner form in 1/T and T
+            tausi[j] = (Ai[j] + Tinv*(Bi[j] + Gi[j]*Tinv) + Ei[j]*logT
+                        + T*(Fi[j] + Hi[j]*T))
     return taus
 
 def nrtl_dtaus_dT(T, N, B, E, F, G, H, dtaus_dT=None):
@@ -215,6 +214,34 @@ def nrtl_Gs(N, alphas, taus, Gs=None):
             Gsi[j] = exp(-alphasi[j]*tausi[j])
     return Gs
 
+def nrtl_taus_and_Gs(T, N, A, B, E, F, G, H, alphas, taus=None, Gs=None):
+    # Same as nrtl_taus followed by nrtl_Gs but in a single pass
+    if taus is None:
+        taus = [[0.0]*N for _ in range(N)] # numba: delete
+#        taus = zeros((N, N)) # numba: uncomment
+    if Gs is None:
+        Gs = [[0.0]*N for _ in range(N)] # numba: delete
+#        Gs = zeros((N, N)) # numba: uncomment
+
+    Tinv = 1.0/T
+    logT = log(T)
+    for i in range(N):
+        Ai = A[i]
+        Bi = B[i]
+        Ei = E[i]
+        Fi = F[i]
+        Gi = G[i]
+        Hi = H[i]
+        alphasi = alphas[i]
+        tausi = taus[i]
+        Gsi = Gs[i]
+        for j in range(N):
+            tau = (Ai[j] + Tinv*(Bi[j] + Gi[j]*Tinv) + Ei[j]*logT
+                   + T*(Fi[j] + Hi[j]*T))
+            tausi[j] = tau
+            Gsi[j] = exp(-alphasi[j]*tau)
+    return taus, Gs
+
 def nrtl_dGs_dT(N, alphas, dalphas_dT, taus, dtaus_dT, Gs, dGs_dT=None):
     if dGs_dT is None:
         dGs_dT = [[0.0]*N for _ in range(N)] # numba: delete
@@ -319,6 +346,23 @@ def nrtl_xj_Gs_taus_jis(N, xs, Gs, taus, xj_Gs_taus_jis=None):
         xj_Gs_taus_jis[i] = tot2
     return xj_Gs_taus_jis
 
+def nrtl_xj_dGs_dT_jis_and_taus_dGs_dT_jis(N, xs, dGs_dT, taus, xj_dGs_dT_jis=None, xj_taus_dGs_dT_jis=None):
+    if xj_dGs_dT_jis is None:
+        xj_dGs_dT_jis = [0.0]*N
+    if xj_taus_dGs_dT_jis is None:
+        xj_taus_dGs_dT_jis = [0.0]*N
+
+    for i in range(N):
+        tot3 = 0.0
+        tot4 = 0.0
+        for j in range(N):
+            xjdGji = xs[j]*dGs_dT[j][i]
+            tot3 += xjdGji
+            tot4 += xjdGji*taus[j][i]
+        xj_dGs_dT_jis[i] = tot3
+        xj_taus_dGs_dT_jis[i] = tot4
+    return xj_dGs_dT_jis, xj_taus_dGs_dT_jis
+
 def nrtl_GE(N, T, xs, xj_Gs_taus_jis, xj_Gs_jis_inv):
     GE = 0.0
     for i in range(N):
@@ -380,16 +424,27 @@ def nrtl_d2GE_dT2(N, T, xs, taus, dtaus_dT, d2taus_dT2, Gs, dGs_dT, d2Gs_dT2):
     d2GE_dT2 = R*tot
     return d2GE_dT2
 
-def nrtl_dGE_dxs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, dGE_dxs=None):
+def nrtl_dGE_dxs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, dGE_dxs=None, vec0=None, vec1=None):
     if dGE_dxs is None:
         dGE_dxs = [0.0]*N
+    if vec0 is None:
+        vec0 = [0.0]*N
+    if vec1 is None:
+        vec1 = [0.0]*N
+
+    # Only Gs and taus depend on k
+    for i in range(N):
+        vec0[i] = xs[i]*xj_Gs_jis_inv[i]
+        vec1[i] = xj_Gs_jis_inv[i]*xj_Gs_taus_jis[i]
 
     RT = R*T
     for k in range(N):
         # k is what is being differentiated
-        tot = xj_Gs_taus_jis[k]*xj_Gs_jis_inv[k]
+        tot = vec1[k]
+        Gsk = Gs[k]
+        tausk = taus[k]
         for i in range(N):
-            tot += xs[i]*xj_Gs_jis_inv[i]*Gs[k][i]*(taus[k][i] - xj_Gs_jis_inv[i]*xj_Gs_taus_jis[i])
+            tot += vec0[i]*Gsk[i]*(tausk[i] - vec1[i])
         dGE_dxs[k] = tot*RT
     return dGE_dxs
 
@@ -398,26 +453,35 @@ def nrtl_d2GE_dxixjs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, d2GE_dxi
         d2GE_dxixjs = [[0.0]*N for _ in range(N)] # numba: delete
 #        d2GE_dxixjs = zeros((N, N)) # numba: uncomment
 
+    # Powers of the inverse sums do not depend on i or j
+    inv2 = [0.0]*N
+    w2 = [0.0]*N
+    w3 = [0.0]*N
+    for k in range(N):
+        inv2[k] = xj_Gs_jis_inv[k]*xj_Gs_jis_inv[k]
+        w2[k] = xs[k]*inv2[k]
+        w3[k] = 2.0*w2[k]*xj_Gs_taus_jis[k]*xj_Gs_jis_inv[k]
+
     RT = R*T
     for i in range(N):
         row = d2GE_dxixjs[i]
+        Gsi = Gs[i]
+        tausi = taus[i]
         for j in range(N):
+            Gsj = Gs[j]
+            tausj = taus[j]
             tot = 0.0
             # two small terms
-            tot += Gs[i][j]*taus[i][j]*xj_Gs_jis_inv[j]
-            tot += Gs[j][i]*taus[j][i]*xj_Gs_jis_inv[i]
+            tot += Gsi[j]*tausi[j]*xj_Gs_jis_inv[j]
+            tot += Gsj[i]*tausj[i]*xj_Gs_jis_inv[i]
 
             # Two large terms
-            tot -= xj_Gs_taus_jis[j]*Gs[i][j]*(xj_Gs_jis_inv[j]*xj_Gs_jis_inv[j])
-            tot -= xj_Gs_taus_jis[i]*Gs[j][i]*(xj_Gs_jis_inv[i]*xj_Gs_jis_inv[i])
+            tot -= xj_Gs_taus_jis[j]*Gsi[j]*inv2[j]
+            tot -= xj_Gs_taus_jis[i]*Gsj[i]*inv2[i]
 
-            # Three terms
+            # Three terms and 6 terms
             for k in range(N):
-                tot += 2.0*xs[k]*xj_Gs_taus_jis[k]*Gs[i][k]*Gs[j][k]*(xj_Gs_jis_inv[k]*xj_Gs_jis_inv[k]*xj_Gs_jis_inv[k])
-
-            # 6 terms
-            for k in range(N):
-                tot -= xs[k]*Gs[i][k]*Gs[j][k]*(taus[j][k] + taus[i][k])*xj_Gs_jis_inv[k]*xj_Gs_jis_inv[k]
+                tot += Gsi[k]*Gsj[k]*(w3[k] - w2[k]*(tausj[k] + tausi[k]))
 
             tot *= RT
             row[j] = tot
@@ -425,13 +489,18 @@ def nrtl_d2GE_dxixjs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, d2GE_dxi
 
 def nrtl_d2GE_dTdxs(N, T, xs, taus, dtaus_dT, Gs, dGs_dT, xj_Gs_taus_jis,
                     xj_Gs_jis_inv, xj_dGs_dT_jis, xj_taus_dGs_dT_jis,
-                    xj_Gs_dtaus_dT_jis, d2GE_dTdxs=None, vec0=None, vec1=None):
+                    xj_Gs_dtaus_dT_jis, d2GE_dTdxs=None, vec0=None, vec1=None,
+                    vec2=None, vec3=None):
     if d2GE_dTdxs is None:
         d2GE_dTdxs = [0.0]*N
     if vec0 is None:
         vec0 = [0.0]*N
     if vec1 is None:
         vec1 = [0.0]*N
+    if vec2 is None:
+        vec2 = [0.0]*N
+    if vec3 is None:
+        vec3 = [0.0]*N
 
     sum1 = xj_Gs_jis_inv
     sum2 = xj_Gs_taus_jis
@@ -439,10 +508,12 @@ def nrtl_d2GE_dTdxs(N, T, xs, taus, dtaus_dT, Gs, dGs_dT, xj_Gs_taus_jis,
     sum4 = xj_taus_dGs_dT_jis
     sum5 = xj_Gs_dtaus_dT_jis
 
+    # Everything that depends only on j is computed once
     for i in range(N):
         vec0[i] = xs[i]*sum1[i]
-    for i in range(N):
         vec1[i] = sum1[i]*sum2[i]
+        vec2[i] = sum1[i]*sum3[i]
+        vec3[i] = sum1[i]*(sum5[i] + sum4[i] - 2.0*sum3[i]*vec1[i])
 
     for i in range(N):
         others = vec1[i]
@@ -450,10 +521,12 @@ def nrtl_d2GE_dTdxs(N, T, xs, taus, dtaus_dT, Gs, dGs_dT, xj_Gs_taus_jis,
 
         Gsi = Gs[i]
         tausi = taus[i]
+        dGs_dTi = dGs_dT[i]
+        dtaus_dTi = dtaus_dT[i]
         for j in range(N):
-            t0 = vec1[j]*dGs_dT[i][j]
-            t0 += sum1[j]*Gsi[j]*(sum3[j]*(tausi[j] - vec1[j] - vec1[j]) + sum5[j] + sum4[j]) # Could store and factor this stuff out but just makes it slower
-            t0 -= (Gsi[j]*dtaus_dT[i][j] + tausi[j]*dGs_dT[i][j])
+            t0 = vec1[j]*dGs_dTi[j]
+            t0 += Gsi[j]*(vec2[j]*tausi[j] + vec3[j])
+            t0 -= (Gsi[j]*dtaus_dTi[j] + tausi[j]*dGs_dTi[j])
 
             tot1 += t0*vec0[j]
 
@@ -705,28 +778,35 @@ class NRTL(GibbsExcess):
         # Make an array of values identifying what coefficients are zero.
         # This may be useful for performance optimization in the future but is
         # especially important for reducing the size of the __repr__ string.
-        self.tau_coeffs_nonzero = tau_coeffs_nonzero = [True]*6 if scalar else ones(6, bool)
-        for k, coeffs in enumerate([self.tau_as, self.tau_bs, self.tau_es,
-                           self.tau_fs, self.tau_gs, self.tau_hs]):
-            nonzero = False
+        all_tau_coeffs = (self.tau_as, self.tau_bs, self.tau_es,
+                          self.tau_fs, self.tau_gs, self.tau_hs)
+        if scalar:
+            self.tau_coeffs_nonzero = tau_coeffs_nonzero = [True]*6
+            for k, coeffs in enumerate(all_tau_coeffs):
+                nonzero = False
+                for i in range(N):
+                    r = coeffs[i]
+                    for j in range(N):
+                        if r[j] != 0.0:
+                            nonzero = True
+                            break
+                    if nonzero:
+                        break
+                tau_coeffs_nonzero[k] = nonzero
+
+            alpha_ds = self.alpha_ds
+            alpha_temperature_independent = True
             for i in range(N):
-                r = coeffs[i]
+                r = alpha_ds[i]
                 for j in range(N):
                     if r[j] != 0.0:
-                        nonzero = True
+                        alpha_temperature_independent = False
                         break
-                if nonzero:
+                if not alpha_temperature_independent:
                     break
-            tau_coeffs_nonzero[k] = nonzero
-
-
-        alpha_ds = self.alpha_ds
-        alpha_temperature_independent = True
-        for i in range(N):
-            r = alpha_ds[i]
-            for j in range(N):
-                if r[j] != 0.0:
-                    alpha_temperature_independent = False
+        else:
+            self.tau_coeffs_nonzero = array([bool(coeffs.any()) for coeffs in all_tau_coeffs])
+            alpha_temperature_independent = not self.alpha_ds.any()
         self.alpha_temperature_independent = alpha_temperature_independent
 
 
@@ -764,7 +844,9 @@ class NRTL(GibbsExcess):
         -----
         If the new temperature is the same temperature as the existing
         temperature, if the `tau`, `Gs`, or `alphas` terms or their derivatives
-        have been calculated, they will be set to the new object as well.
+        have been calculated, they will be set to the new object as well. This
+        includes the transposed and `tau`-weighted copies of `Gs`, so only the
+        composition-dependent sums are recalculated.
         '''
         new = self.__class__.__new__(self.__class__)
         (new.T, new.xs, new.N, new.scalar) = T, xs, self.N, self.scalar
@@ -812,6 +894,18 @@ class NRTL(GibbsExcess):
                 new._d3Gs_dT3 = self._d3Gs_dT3
             except AttributeError:
                 pass
+            try:
+                new._Gs_transposed = self._Gs_transposed
+            except AttributeError:
+                pass
+            try:
+                new._Gs_taus_transposed = self._Gs_taus_transposed
+            except AttributeError:
+                pass
+            try:
+                new._Gs_taus = self._Gs_taus
+            except AttributeError:
+                pass
 
         new.zero_coeffs = self.zero_coeffs
         return new
@@ -836,10 +930,11 @@ class NRTL(GibbsExcess):
 
         if self.scalar:
             gammas = [0.0]*self.N
+            self._gammas = nrtl_gammas(xs, N, Gs, taus, xj_Gs_jis_inv, xj_Gs_taus_jis, gammas)
         else:
-            gammas = zeros(self.N)
-
-        self._gammas = nrtl_gammas(xs, N, Gs, taus, xj_Gs_jis_inv, xj_Gs_taus_jis, gammas)
+            vec0 = xs*xj_Gs_jis_inv
+            vec1 = xj_Gs_taus_jis*xj_Gs_jis_inv
+            self._gammas = gammas = npexp(vec1 + dot(self.Gs_taus(), vec0) - dot(Gs, vec0*vec1))
         return gammas
 
 
@@ -873,10 +968,21 @@ class NRTL(GibbsExcess):
         T, N = self.T, self.N
         if self.scalar:
             taus = [[0.0]*N for _ in range(N)]
+            self._taus = nrtl_taus(T, N, A, B, E, F, G, H, taus)
         else:
-            taus = zeros((N, N))
-
-        self._taus = nrtl_taus(T, N, A, B, E, F, G, H, taus)
+            # Skip the terms whose coefficients are all zero; often only A
+            # and B are used
+            _, _, E_used, F_used, G_used, H_used = self.tau_coeffs_nonzero
+            Tinv = 1.0/T
+            if G_used:
+                taus = A + Tinv*(B + G*Tinv)
+            else:
+                taus = A + Tinv*B
+            if E_used:
+                taus += E*log(T)
+            if F_used or H_used:
+                taus += T*(F + H*T)
+            self._taus = taus
         return taus
 
     def dtaus_dT(self):
@@ -909,10 +1015,22 @@ class NRTL(GibbsExcess):
         T, N = self.T, self.N
         if self.scalar:
             dtaus_dT = [[0.0]*N for _ in range(N)]
+            self._dtaus_dT = nrtl_dtaus_dT(T, N, B, E, F, G, H, dtaus_dT)
         else:
-            dtaus_dT = zeros((N, N))
-        self._dtaus_dT = nrtl_dtaus_dT(T, N, B, E, F, G, H, dtaus_dT)
-
+            _, _, E_used, F_used, G_used, H_used = self.tau_coeffs_nonzero
+            Tinv = 1.0/T
+            nT2inv = -Tinv*Tinv
+            if F_used:
+                dtaus_dT = F + nT2inv*B
+            else:
+                dtaus_dT = nT2inv*B
+            if E_used:
+                dtaus_dT += Tinv*E
+            if G_used:
+                dtaus_dT += (2.0*nT2inv*Tinv)*G
+            if H_used:
+                dtaus_dT += (T + T)*H
+            self._dtaus_dT = dtaus_dT
         return dtaus_dT
 
     def d2taus_dT2(self):
@@ -944,10 +1062,20 @@ class NRTL(GibbsExcess):
 
         if self.scalar:
             d2taus_dT2 = [[0.0]*N for _ in range(N)]
+            self._d2taus_dT2 = nrtl_d2taus_dT2(T, N, B, E, G, H, d2taus_dT2)
         else:
-            d2taus_dT2 = zeros((N, N))
-
-        self._d2taus_dT2 = nrtl_d2taus_dT2(T, N, B, E, G, H, d2taus_dT2)
+            _, _, E_used, _, G_used, H_used = self.tau_coeffs_nonzero
+            Tinv = 1.0/T
+            Tinv2 = Tinv*Tinv
+            if H_used:
+                d2taus_dT2 = 2.0*H + (2.0*(Tinv2*Tinv))*B
+            else:
+                d2taus_dT2 = (2.0*(Tinv2*Tinv))*B
+            if E_used:
+                d2taus_dT2 += (-Tinv*Tinv)*E
+            if G_used:
+                d2taus_dT2 += (6.0*(Tinv2*Tinv2))*G
+            self._d2taus_dT2 = d2taus_dT2
         return d2taus_dT2
 
     def d3taus_dT3(self):
@@ -977,9 +1105,17 @@ class NRTL(GibbsExcess):
         T, N = self.T, self.N
         if self.scalar:
             d3taus_dT3 = [[0.0]*N for _ in range(N)]
+            self._d3taus_dT3 = nrtl_d3taus_dT3(T, N, B, E, G, d3taus_dT3)
         else:
-            d3taus_dT3 = zeros((N, N))
-        self._d3taus_dT3 = nrtl_d3taus_dT3(T, N, B, E, G, d3taus_dT3)
+            _, _, E_used, _, G_used, _ = self.tau_coeffs_nonzero
+            Tinv = 1.0/T
+            T2inv = Tinv*Tinv
+            d3taus_dT3 = (-6.0*T2inv*T2inv)*B
+            if E_used:
+                d3taus_dT3 += (2.0*T2inv*Tinv)*E
+            if G_used:
+                d3taus_dT3 += (-24.0*(T2inv*T2inv*Tinv))*G
+            self._d3taus_dT3 = d3taus_dT3
         return d3taus_dT3
 
     def alphas(self):
@@ -1019,13 +1155,11 @@ class NRTL(GibbsExcess):
 
         if self.alpha_temperature_independent:
             self._alphas = alphas = self.alpha_cs
-        else:
-            if self.scalar:
-                alphas = [[0.0]*N for _ in range(N)]
-            else:
-                alphas = zeros((N, N))
-
+        elif self.scalar:
+            alphas = [[0.0]*N for _ in range(N)]
             self._alphas = nrtl_alphas(self.T, N, self.alpha_cs, self.alpha_ds, alphas)
+        else:
+            self._alphas = alphas = self.alpha_cs + self.alpha_ds*self.T
         return alphas
 
     def dalphas_dT(self):
@@ -1060,15 +1194,24 @@ class NRTL(GibbsExcess):
         except AttributeError:
             pass
         alphas = self.alphas()
-        taus = self.taus()
         N = self.N
 
         if self.scalar:
             Gs = [[0.0]*N for _ in range(N)]
+            try:
+                taus = self._taus
+            except AttributeError:
+                # Neither is cached yet; build taus and Gs in one pass
+                taus = [[0.0]*N for _ in range(N)]
+                nrtl_taus_and_Gs(self.T, N, self.tau_as, self.tau_bs, self.tau_es,
+                                 self.tau_fs, self.tau_gs, self.tau_hs, alphas,
+                                 taus, Gs)
+                self._taus = taus
+            else:
+                nrtl_Gs(N, alphas, taus, Gs)
         else:
-            Gs = zeros((N, N))
-
-        self._Gs = nrtl_Gs(N, alphas, taus, Gs)
+            Gs = npexp(-alphas*self.taus())
+        self._Gs = Gs
         return Gs
 
     def dGs_dT(self):
@@ -1107,10 +1250,12 @@ class NRTL(GibbsExcess):
 
         if self.scalar:
             dGs_dT = [[0.0]*N for _ in range(N)]
+            nrtl_dGs_dT(N, alphas, dalphas_dT, taus, dtaus_dT, Gs, dGs_dT)
+        elif self.alpha_temperature_independent:
+            dGs_dT = -alphas*dtaus_dT*Gs
         else:
-            dGs_dT = zeros((N, N))
-
-        self._dGs_dT = nrtl_dGs_dT(N, alphas, dalphas_dT, taus, dtaus_dT, Gs, dGs_dT)
+            dGs_dT = (-alphas*dtaus_dT - taus*dalphas_dT)*Gs
+        self._dGs_dT = dGs_dT
         return dGs_dT
 
     def d2Gs_dT2(self):
@@ -1155,10 +1300,14 @@ class NRTL(GibbsExcess):
 
         if self.scalar:
             d2Gs_dT2 = [[0.0]*N for _ in range(N)]
+            nrtl_d2Gs_dT2(N, alphas, dalphas_dT, taus, dtaus_dT, d2taus_dT2, Gs, d2Gs_dT2)
+        elif self.alpha_temperature_independent:
+            t1 = alphas*dtaus_dT
+            d2Gs_dT2 = (t1*t1 - alphas*d2taus_dT2)*Gs
         else:
-            d2Gs_dT2 = zeros((N, N))
-
-        self._d2Gs_dT2 = nrtl_d2Gs_dT2(N, alphas, dalphas_dT, taus, dtaus_dT, d2taus_dT2, Gs, d2Gs_dT2)
+            t1 = alphas*dtaus_dT + taus*dalphas_dT
+            d2Gs_dT2 = (t1*t1 - alphas*d2taus_dT2 - 2.0*dalphas_dT*dtaus_dT)*Gs
+        self._d2Gs_dT2 = d2Gs_dT2
         return d2Gs_dT2
 
     def d3Gs_dT3(self):
@@ -1207,10 +1356,15 @@ class NRTL(GibbsExcess):
 
         if self.scalar:
             d3Gs_dT3 = [[0.0]*N for _ in range(N)]
+            nrtl_d3Gs_dT3(N, alphas, dalphas_dT, taus, dtaus_dT, d2taus_dT2, d3taus_dT3, Gs, d3Gs_dT3)
+        elif self.alpha_temperature_independent:
+            x5 = alphas*dtaus_dT
+            d3Gs_dT3 = Gs*(-alphas*d3taus_dT3 - x5*x5*x5 + 3.0*x5*(alphas*d2taus_dT2))
         else:
-            d3Gs_dT3 = zeros((N, N))
-
-        self._d3Gs_dT3 = nrtl_d3Gs_dT3(N, alphas, dalphas_dT, taus, dtaus_dT, d2taus_dT2, d3taus_dT3, Gs, d3Gs_dT3)
+            x5 = alphas*dtaus_dT + taus*dalphas_dT
+            d3Gs_dT3 = Gs*(-alphas*d3taus_dT3 - 3.0*dalphas_dT*d2taus_dT2 - x5*x5*x5
+                           + 3.0*x5*(alphas*d2taus_dT2 + 2.0*dalphas_dT*dtaus_dT))
+        self._d3Gs_dT3 = d3Gs_dT3
         return d3Gs_dT3
 
     def Gs_transposed(self):
@@ -1278,24 +1432,24 @@ class NRTL(GibbsExcess):
             taus = self._taus
         except AttributeError:
             taus = self.taus()
-        try:
-            Gs_transposed = self._Gs_transposed
-        except AttributeError:
-            Gs_transposed = self.Gs_transposed()
-        try:
-            Gs_taus_transposed = self._Gs_taus_transposed
-        except AttributeError:
-            Gs_taus_transposed = self.Gs_taus_transposed()
 
         xs, N = self.xs, self.N
         if self.scalar:
+            try:
+                Gs_transposed = self._Gs_transposed
+            except AttributeError:
+                Gs_transposed = self.Gs_transposed()
+            try:
+                Gs_taus_transposed = self._Gs_taus_transposed
+            except AttributeError:
+                Gs_taus_transposed = self.Gs_taus_transposed()
             _xj_Gs_jis = [0.0]*N
             _xj_Gs_taus_jis = [0.0]*N
+            nrtl_xj_Gs_jis_and_Gs_taus_jis(N, xs, Gs, taus, Gs_transposed, Gs_taus_transposed, _xj_Gs_jis, _xj_Gs_taus_jis)
         else:
-            _xj_Gs_jis = zeros(N)
-            _xj_Gs_taus_jis = zeros(N)
-
-        nrtl_xj_Gs_jis_and_Gs_taus_jis(N, xs, Gs, taus, Gs_transposed, Gs_taus_transposed, _xj_Gs_jis, _xj_Gs_taus_jis)
+            # Column sums as matrix-vector products
+            _xj_Gs_jis = dot(xs, Gs)
+            _xj_Gs_taus_jis = dot(xs, self.Gs_taus())
 
         self._xj_Gs_jis, self._xj_Gs_taus_jis = _xj_Gs_jis, _xj_Gs_taus_jis
         return _xj_Gs_jis
@@ -1357,10 +1511,18 @@ class NRTL(GibbsExcess):
 
         xs, N = self.xs, self.N
         if self.scalar:
+            # sum3 and sum4 share the xj*dGji products; compute both
+            try:
+                taus = self._taus
+            except AttributeError:
+                taus = self.taus()
             xj_dGs_dT_jis = [0.0]*N
+            xj_taus_dGs_dT_jis = [0.0]*N
+            nrtl_xj_dGs_dT_jis_and_taus_dGs_dT_jis(N, xs, dGs_dT, taus, xj_dGs_dT_jis, xj_taus_dGs_dT_jis)
+            self._xj_taus_dGs_dT_jis = xj_taus_dGs_dT_jis
         else:
-            xj_dGs_dT_jis = zeros(N)
-        self._xj_dGs_dT_jis = nrtl_xj_Gs_jis(N, xs, dGs_dT, xj_dGs_dT_jis)
+            xj_dGs_dT_jis = dot(xs, dGs_dT)
+        self._xj_dGs_dT_jis = xj_dGs_dT_jis
         return xj_dGs_dT_jis
 
     def xj_taus_dGs_dT_jis(self):
@@ -1369,7 +1531,11 @@ class NRTL(GibbsExcess):
             return self._xj_taus_dGs_dT_jis
         except AttributeError:
             pass
-        xs, N = self.xs, self.N
+        if self.scalar:
+            # Calculated together with sum3
+            self.xj_dGs_dT_jis()
+            return self._xj_taus_dGs_dT_jis
+        xs = self.xs
         try:
             dGs_dT = self._dGs_dT
         except AttributeError:
@@ -1378,13 +1544,7 @@ class NRTL(GibbsExcess):
             taus = self._taus
         except AttributeError:
             taus = self.taus()
-
-        if self.scalar:
-            xj_taus_dGs_dT_jis = [0.0]*N
-        else:
-            xj_taus_dGs_dT_jis = zeros(N)
-        self._xj_taus_dGs_dT_jis = nrtl_xj_Gs_taus_jis(N, xs, dGs_dT, taus, xj_taus_dGs_dT_jis)
-
+        self._xj_taus_dGs_dT_jis = xj_taus_dGs_dT_jis = dot(xs, dGs_dT*taus)
         return xj_taus_dGs_dT_jis
 
     def xj_Gs_dtaus_dT_jis(self):
@@ -1405,9 +1565,9 @@ class NRTL(GibbsExcess):
 
         if self.scalar:
             xj_Gs_dtaus_dT_jis = [0.0]*N
+            self._xj_Gs_dtaus_dT_jis = nrtl_xj_Gs_taus_jis(N, xs, Gs, dtaus_dT, xj_Gs_dtaus_dT_jis)
         else:
-            xj_Gs_dtaus_dT_jis = zeros(N)
-        self._xj_Gs_dtaus_dT_jis = nrtl_xj_Gs_taus_jis(N, xs, Gs, dtaus_dT, xj_Gs_dtaus_dT_jis)
+            self._xj_Gs_dtaus_dT_jis = xj_Gs_dtaus_dT_jis = dot(xs, Gs*dtaus_dT)
         return xj_Gs_dtaus_dT_jis
 
     def GE(self):
@@ -1432,13 +1592,17 @@ class NRTL(GibbsExcess):
             pass
         try:
             xj_Gs_jis_inv = self._xj_Gs_jis_inv
-        except:
+        except AttributeError:
             xj_Gs_jis_inv = self.xj_Gs_jis_inv()
         try:
             xj_Gs_taus_jis = self._xj_Gs_taus_jis
-        except:
+        except AttributeError:
             xj_Gs_taus_jis = self.xj_Gs_taus_jis()
-        self._GE = GE = nrtl_GE(self.N, self.T, self.xs, xj_Gs_taus_jis, xj_Gs_jis_inv)
+        if self.scalar:
+            GE = nrtl_GE(self.N, self.T, self.xs, xj_Gs_taus_jis, xj_Gs_jis_inv)
+        else:
+            GE = dot(self.xs*xj_Gs_taus_jis, xj_Gs_jis_inv)*(self.T*R)
+        self._GE = GE
         return GE
 
     def dGE_dT(self):
@@ -1468,18 +1632,22 @@ class NRTL(GibbsExcess):
         T, xs, N = self.T, self.xs, self.N
         try:
             xj_Gs_jis_inv = self._xj_Gs_jis_inv
-        except:
+        except AttributeError:
             xj_Gs_jis_inv = self.xj_Gs_jis_inv() # sum1 inv
         try:
             xj_Gs_taus_jis = self._xj_Gs_taus_jis
-        except:
+        except AttributeError:
             xj_Gs_taus_jis = self.xj_Gs_taus_jis() # sum2
 
         xj_dGs_dT_jis = self.xj_dGs_dT_jis() # sum3
         xj_taus_dGs_dT_jis = self.xj_taus_dGs_dT_jis() # sum4
         xj_Gs_dtaus_dT_jis = self.xj_Gs_dtaus_dT_jis() # sum5
 
-        self._dGE_dT = nrtl_dGE_dT(N, T, xs, xj_Gs_taus_jis, xj_Gs_jis_inv, xj_dGs_dT_jis, xj_taus_dGs_dT_jis, xj_Gs_dtaus_dT_jis)
+        if self.scalar:
+            self._dGE_dT = nrtl_dGE_dT(N, T, xs, xj_Gs_taus_jis, xj_Gs_jis_inv, xj_dGs_dT_jis, xj_taus_dGs_dT_jis, xj_Gs_dtaus_dT_jis)
+        else:
+            self._dGE_dT = R*dot(xs, (xj_Gs_taus_jis + T*((xj_taus_dGs_dT_jis + xj_Gs_dtaus_dT_jis)
+                                - (xj_Gs_taus_jis*xj_dGs_dT_jis)*xj_Gs_jis_inv))*xj_Gs_jis_inv)
         return self._dGE_dT
 
 
@@ -1520,7 +1688,26 @@ class NRTL(GibbsExcess):
         dGs_dT = self.dGs_dT()
         d2Gs_dT2 = self.d2Gs_dT2()
 
-        self._d2GE_dT2 = d2GE_dT2 = nrtl_d2GE_dT2(N, T, xs, taus, dtaus_dT, d2taus_dT2, Gs, dGs_dT, d2Gs_dT2)
+        if self.scalar:
+            d2GE_dT2 = nrtl_d2GE_dT2(N, T, xs, taus, dtaus_dT, d2taus_dT2, Gs, dGs_dT, d2Gs_dT2)
+        else:
+            # Each column sum over j is a matrix-vector product
+            sum2 = self.xj_Gs_taus_jis()
+            sum3 = self.xj_dGs_dT_jis()
+            sum45 = self.xj_taus_dGs_dT_jis() + self.xj_Gs_dtaus_dT_jis()
+            sum6 = dot(xs, d2Gs_dT2)
+            sum7 = dot(xs, taus*d2Gs_dT2)
+            sum8 = dot(xs, Gs*d2taus_dT2)
+            sum9 = dot(xs, dGs_dT*dtaus_dT)
+            sum1_inv = self.xj_Gs_jis_inv()
+
+            terms = (-T*sum2*(sum6 - 2.0*sum3*sum3*sum1_inv)*sum1_inv
+                     + T*(sum7 + sum8 + 2.0*sum9)
+                     - 2.0*T*(sum3*sum45)*sum1_inv
+                     - 2.0*(sum2*sum3)*sum1_inv
+                     + 2.0*sum45)
+            d2GE_dT2 = R*dot(xs*sum1_inv, terms)
+        self._d2GE_dT2 = d2GE_dT2
         return d2GE_dT2
 
     def dGE_dxs(self):
@@ -1579,10 +1766,12 @@ class NRTL(GibbsExcess):
         xj_Gs_taus_jis = self.xj_Gs_taus_jis()
         if self.scalar:
             dGE_dxs = [0.0]*N
+            nrtl_dGE_dxs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, dGE_dxs)
         else:
-            dGE_dxs = zeros(N)
-
-        self._dGE_dxs = nrtl_dGE_dxs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, dGE_dxs)
+            vec0 = xs*xj_Gs_jis_inv
+            vec1 = xj_Gs_taus_jis*xj_Gs_jis_inv
+            dGE_dxs = (vec1 + dot(self.Gs_taus(), vec0) - dot(Gs, vec0*vec1))*(R*T)
+        self._dGE_dxs = dGE_dxs
         return dGE_dxs
 
     def d2GE_dxixjs(self):
@@ -1661,10 +1850,20 @@ class NRTL(GibbsExcess):
         xj_Gs_taus_jis = self.xj_Gs_taus_jis()
         if self.scalar:
             d2GE_dxixjs = [[0.0]*N for _ in range(N)]
+            nrtl_d2GE_dxixjs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, d2GE_dxixjs)
         else:
-            d2GE_dxixjs = zeros((N, N))
-
-        self._d2GE_dxixjs = nrtl_d2GE_dxixjs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, d2GE_dxixjs)
+            # Every term is of the form Q_ij + Q_ji; the sums over k become
+            # matrix products with a weighted Gs
+            Gs_taus = self.Gs_taus()
+            inv2 = xj_Gs_jis_inv*xj_Gs_jis_inv
+            vk = xs*inv2
+            Q = Gs_taus*xj_Gs_jis_inv
+            Q -= Gs*(xj_Gs_taus_jis*inv2)
+            Q += dot(Gs*(vk*xj_Gs_taus_jis*xj_Gs_jis_inv), Gs.T)
+            Q -= dot(Gs*vk, Gs_taus.T)
+            d2GE_dxixjs = Q + Q.T
+            d2GE_dxixjs *= R*T
+        self._d2GE_dxixjs = d2GE_dxixjs
         return d2GE_dxixjs
 
 
@@ -1719,12 +1918,30 @@ class NRTL(GibbsExcess):
         dGs_dT = self.dGs_dT()
         if self.scalar:
             d2GE_dTdxs = [0.0]*N
+            nrtl_d2GE_dTdxs(N, T, xs, taus, dtaus_dT, Gs, dGs_dT, xj_Gs_taus_jis,
+                            xj_Gs_jis_inv, xj_dGs_dT_jis, xj_taus_dGs_dT_jis,
+                            xj_Gs_dtaus_dT_jis, d2GE_dTdxs)
         else:
-            d2GE_dTdxs = zeros(N)
-
-        self._d2GE_dTdxs = nrtl_d2GE_dTdxs(N, T, xs, taus, dtaus_dT, Gs, dGs_dT, xj_Gs_taus_jis,
-                    xj_Gs_jis_inv, xj_dGs_dT_jis, xj_taus_dGs_dT_jis,
-                    xj_Gs_dtaus_dT_jis, d2GE_dTdxs)
+            # Same terms as nrtl_d2GE_dTdxs, with each sum over j done as a
+            # matrix-vector product
+            sum1, sum3 = xj_Gs_jis_inv, xj_dGs_dT_jis
+            sum45 = xj_taus_dGs_dT_jis + xj_Gs_dtaus_dT_jis
+            Gs_taus = self.Gs_taus()
+            vec0 = xs*sum1
+            vec1 = sum1*xj_Gs_taus_jis
+            vec01 = vec0*vec1
+            vec0_sum1 = vec0*sum1
+
+            # d(Gs*taus)/dT, accumulated in place
+            dGs_taus_dT = Gs*dtaus_dT
+            dGs_taus_dT += taus*dGs_dT
+            tot1 = (sum1*(sum3*vec1 - sum45) + dot(dGs_dT, vec01)
+                    + dot(Gs_taus, vec0_sum1*sum3)
+                    + dot(Gs, vec0_sum1*(sum45 - 2.0*sum3*vec1))
+                    - dot(dGs_taus_dT, vec0))
+            others = vec1 + dot(Gs_taus, vec0) - dot(Gs, vec01)
+            d2GE_dTdxs = -R*(T*tot1 - others)
+        self._d2GE_dTdxs = d2GE_dTdxs
         return d2GE_dTdxs
 
 
@@ -1993,7 +2210,7 @@ def NRTL_gammas_binaries_jac(xs, tau12, tau21, alpha12, alpha21, calc=None):
         gamma1_row[3] = -x25*x27*(x23 - 1.0)
     return calc
 
-def NRTL_gammas(xs, taus, alphas):
+def NRTL_gammas(xs, taus, alphas, Gs=None):
     r'''Calculates the activity coefficients of each species in a mixture
     using the Non-Random Two-Liquid (NRTL) method, given their mole fractions,
     dimensionless interaction parameters, and nonrandomness constants. Those
@@ -2019,6 +2236,9 @@ def NRTL_gammas(xs, taus, alphas):
         [-]
     alphas : list[list[float]]
         Nonrandomness constants of each compound interacting with each other, [-]
+    Gs : list[list[float]], optional
+        Precomputed `G` terms; as they depend on temperature only, they can
+        be reused when this is called repeatedly at one temperature, [-]
 
     Returns
     -------
@@ -2072,13 +2292,17 @@ def NRTL_gammas(xs, taus, alphas):
     gammas = []
     cmps = range(len(xs))
     # Gs does not depend on composition
-    Gs = []
-    for i in cmps:
-        alphasi = alphas[i]
-        tausi = taus[i]
-        Gs.append([exp(-alphasi[j]*tausi[j]) for j in cmps])
+    if Gs is None:
+        Gs = []
+        for i in cmps:
+            alphasi = alphas[i]
+            tausi = taus[i]
+            Gs.append([exp(-alphasi[j]*tausi[j]) for j in cmps])
 
 
+    # Column sums over k of xs[k]*Gs[k][j] and xs[k]*Gs[k][j]*taus[k][j];
+    # these are also the per-component sums of the first term
+    tn1s = []
     td2s = []
     tn3s = []
     for j in cmps:
@@ -2090,20 +2314,17 @@ def NRTL_gammas(xs, taus, alphas):
             tn3 += xkGkj*taus[k][j]
         td2 = 1.0/td2
         td2xj = td2*xs[j]
+        tn1s.append(tn3*td2)
         td2s.append(td2xj)
         tn3s.append(tn3*td2*td2xj)
 
     for i in cmps:
-        tn1, td1, total2 = 0., 0., 0.
+        total2 = 0.
         Gsi = Gs[i]
         tausi = taus[i]
         for j in cmps:
-            xjGji = xs[j]*Gs[j][i]
-
-            td1 += xjGji
-            tn1 += xjGji*taus[j][i]
             total2 += Gsi[j]*(tausi[j]*td2s[j] - tn3s[j])
 
-        gamma = exp(tn1/td1 + total2)
+        gamma = exp(tn1s[i] + total2)
         gammas.append(gamma)
     return gammas
@@ -206,12 +206,14 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'nrtl.nrtl_d3taus_dT3',
                  'nrtl.nrtl_alphas',
                  'nrtl.nrtl_Gs',
+                 'nrtl.nrtl_taus_and_Gs',
                  'nrtl.nrtl_dGs_dT',
                  'nrtl.nrtl_d2Gs_dT2',
                  'nrtl.nrtl_d3Gs_dT3',
                  'nrtl.nrtl_xj_Gs_jis_and_Gs_taus_jis',
                  'nrtl.nrtl_xj_Gs_jis',
                  'nrtl.nrtl_xj_Gs_taus_jis',
+                 'nrtl.nrtl_xj_dGs_dT_jis_and_taus_dGs_dT_jis',
                  'nrtl.nrtl_dGE_dxs',
                  'nrtl.nrtl_d2GE_dxixjs',
                  'nrtl.nrtl_d2GE_dTdxs',
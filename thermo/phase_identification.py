@@ -95,8 +95,8 @@ __all__ = ['vapor_score_Tpc', 'vapor_score_Vpc',
 
 
 from chemicals.flash_basic import Wilson_K_value
-from chemicals.rachford_rice import Rachford_Rice_flash_error
 from chemicals.utils import Vm_to_rho, phase_identification_parameter
+from fluids.numerics import exp
 
 
 def vapor_score_Tpc(T, Tcs, zs):
@@ -396,11 +396,16 @@ def vapor_score_Wilson(T, P, zs, Tcs, Pcs, omegas):
         return P - Psat
     # Does not work for pure compounds
     # Posivie - vapor, negative - liquid
-    Ks = [Wilson_K_value(T, P, Tcs[i], Pcs[i], omegas[i]) for i in range(N)]
     # Consider a vapor fraction of more than 0.5 a vapor
 #    return flash_inner_loop(zs, Ks)[0] - 0.5
     # Go back to the error once unit tested
-    return Rachford_Rice_flash_error(V_over_F=0.5, zs=zs, Ks=Ks)
+    # Wilson K values and the Rachford-Rice error at V/F = 0.5 in one pass
+    T_inv, P_inv = 1.0/T, 1.0/P
+    err = 0.0
+    for i in range(N):
+        K_minus_1 = Pcs[i]*P_inv*exp(5.37*(1.0 + omegas[i])*(1.0 - Tcs[i]*T_inv)) - 1.0
+        err += zs[i]*K_minus_1/(1.0 + 0.5*K_minus_1)
+    return err
 
 
 def vapor_score_Poling(kappa):
@@ -794,7 +799,6 @@ def identity_phase_states(phases, constants, correlations, VL_method=VL_ID_PIP,
     solids = []
     liquids = []
     possible_gases = []
-    possible_gas_scores = []
     unknown_phases = []
     for p in phases:
         if p.force_phase is not None:
@@ -815,19 +819,22 @@ def identity_phase_states(phases, constants, correlations, VL_method=VL_ID_PIP,
             S_scores = score_phases_S(unknown_phases, constants, correlations,
                                       method=S_method, S_ID_settings=S_ID_settings)
 
+    # Track the most vapor-like scored phase while classifying
+    best_gas, best_gas_score = None, 0.0
     for i in range(len(unknown_phases)):
         if not skip_solids and S_scores[i] >= 0.0:
             solids.append(unknown_phases[i])
         elif VL_scores[i] >= 0.0:
             possible_gases.append(unknown_phases[i])
-            possible_gas_scores.append(VL_scores[i])
+            if best_gas is None or VL_scores[i] > best_gas_score:
+                best_gas, best_gas_score = unknown_phases[i], VL_scores[i]
         else:
             liquids.append(unknown_phases[i])
 
     # Handle multiple matches as gas
     possible_gas_count = len(possible_gases)
     if possible_gas_count > 1:
-        gas = possible_gases[possible_gas_scores.index(max(possible_gas_scores))]
+        gas = best_gas
         for possible_gas in possible_gases:
             if possible_gas is not gas:
                 liquids.append(possible_gas)
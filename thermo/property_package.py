@@ -41,11 +41,10 @@ try:
 except:
     pass
 
-from chemicals.flash_basic import K_value, Wilson_K_value
-from chemicals.rachford_rice import Rachford_Rice_flash_error, flash_inner_loop
+from chemicals.rachford_rice import flash_inner_loop
 from chemicals.utils import normalize, remove_zeros
 from fluids.constants import R
-from fluids.numerics import UnconvergedError, brenth, derivative, exp, log, secant
+from fluids.numerics import NotBoundedError, UnconvergedError, brenth, derivative, exp, log, newton, sqrt
 from fluids.numerics import numpy as np
 
 DIRECT_1P = 'Direct 1 Phase'
@@ -53,39 +52,173 @@ DIRECT_2P = 'Direct 2 Phase'
 RIGOROUS_BISECTION = 'Bisection'
 CAS_H2O = '7732-18-5'
 
-def Rachford_Rice_solution_negative(zs, Ks):
+def Rachford_Rice_Halley(K_minus_1, zs_k_minus_1, V_over_F, xtol=1.48e-8,
+                         maxiter=100, low=None, high=None):
+    # Halley's method on the Rachford-Rice error; the error and both of its
+    # derivatives are accumulated in the same pass over the components.
+    # If `low` and `high` bracket the root of an error that decreases
+    # monotonically between them (true for nonnegative compositions), steps
+    # leaving the bracket are replaced by bisection.
+    N = len(K_minus_1)
+    bracketed = low is not None and high is not None
+    if bracketed and not (low < V_over_F < high):
+        V_over_F = 0.5*(low + high)
+    for _ in range(maxiter):
+        f, df, d2f = 0.0, 0.0, 0.0
+        for i in range(N):
+            # Checked explicitly so numpy float inputs raise like floats do
+            # instead of producing inf/nan
+            den = 1.0 + V_over_F*K_minus_1[i]
+            if den == 0.0:
+                raise ZeroDivisionError("Rachford-Rice error has a pole at the current V/F")
+            inv = 1.0/den
+            t = zs_k_minus_1[i]*inv
+            u = t*K_minus_1[i]*inv
+            f += t
+            df -= u
+            d2f += 2.0*u*K_minus_1[i]*inv
+        den = 2.0*df*df - f*d2f
+        if den == 0.0:
+            raise ZeroDivisionError("Zero derivative in Halley step")
+        step = 2.0*f*df/den
+        if bracketed:
+            if f > 0.0:
+                low = V_over_F
+            else:
+                high = V_over_F
+            V_new = V_over_F - step
+            if not (low < V_new < high):
+                V_new = 0.5*(low + high)
+            step = V_over_F - V_new
+        V_over_F -= step
+        if abs(step) <= abs(xtol*V_over_F):
+            return V_over_F
+    raise UnconvergedError("Failed to converge")
+
+def Rachford_Rice_secant(K_minus_1, zs_k_minus_1, V_over_F, xtol=1.48e-8,
+                         maxiter=100):
+    # Secant iteration on the Rachford-Rice error, following the same steps
+    # as fluids.numerics.secant.
+    N = len(K_minus_1)
+    V0 = V_over_F
+    V1 = V0*1.0001 + 1e-4 if V0 >= 0.0 else V0*1.0001 - 1e-4
+    err0 = err1 = 0.0
+    for i in range(N):
+        err0 += zs_k_minus_1[i]/(1.0 + V0*K_minus_1[i])
+        err1 += zs_k_minus_1[i]/(1.0 + V1*K_minus_1[i])
+    if err0 == 0.0:
+        return V0
+    if err1 == 0.0:
+        return V1
+    for _ in range(maxiter):
+        if err1 == err0:
+            raise UnconvergedError("Convergence failed - previous points are the same")
+        V_over_F = V1 - err1*(V1 - V0)/(err1 - err0)
+        if abs(V0 - V1) <= abs(xtol*V0):
+            return V_over_F
+        V0, err0 = V1, err1
+        V1 = V_over_F
+        err1 = 0.0
+        for i in range(N):
+            err1 += zs_k_minus_1[i]/(1.0 + V1*K_minus_1[i])
+        if err1 == 0.0:
+            return V1
+    raise UnconvergedError("Failed to converge")
+
+def Rachford_Rice_solution_negative(zs, Ks, guess=None):
     try:
-        return flash_inner_loop(zs, Ks)
-    except:
+        return flash_inner_loop(zs, Ks, guess=guess)
+    except Exception:
         pass
     # Only here for backwards compatibility
     # Works when component compositions go negative.
 
 
-    Kmin = min(Ks)
-    Kmax = max(Ks)
-    z_of_Kmax = zs[Ks.index(Kmax)]
-
-    V_over_F_min = ((Kmax-Kmin)*z_of_Kmax - (1.-Kmin))/((1.-Kmin)*(Kmax-1.))
-    V_over_F_max = 1./(1.-Kmin)
-
-    V_over_F_min2 = max(0., V_over_F_min)
-    V_over_F_max2 = min(1., V_over_F_max)
-
-    x0 = (V_over_F_min2 + V_over_F_max2)*0.5
-    try:
-        # Newton's method is marginally faster than brenth
-        V_over_F = secant(Rachford_Rice_flash_error, x0, args=(zs, Ks))
-        # newton skips out of its specified range in some cases, finding another solution
-        # Check for that with asserts, and use brenth if it did
-        assert V_over_F >= V_over_F_min2
-        assert V_over_F <= V_over_F_max2
-    except:
-        V_over_F = brenth(Rachford_Rice_flash_error, V_over_F_max-1E-7, V_over_F_min+1E-7, args=(zs, Ks))
-    # Cases not covered by the above solvers: When all components have K > 1, or all have K < 1
-    # Should get a solution for all other cases.
-    xs = [zi/(1.+V_over_F*(Ki-1.)) for zi, Ki in zip(zs, Ks)]
-    ys = [Ki*xi for xi, Ki in zip(xs, Ks)]
+    # Find the extreme K values and the K-1 terms (which do not depend on
+    # V/F) in a single pass
+    N = len(Ks)
+    Kmin = Kmax = Ks[0]
+    i_max = 0
+    K_minus_1 = [0.0]*N
+    zs_k_minus_1 = [0.0]*N
+    zs_nonnegative = True
+    for i in range(N):
+        Ki = Ks[i]
+        if zs[i] < 0.0:
+            zs_nonnegative = False
+        if Ki > Kmax:
+            Kmax = Ki
+            i_max = i
+        elif Ki < Kmin:
+            Kmin = Ki
+        K_minus_1[i] = Ki - 1.0
+        zs_k_minus_1[i] = zs[i]*K_minus_1[i]
+    z_of_Kmax = zs[i_max]
+
+    if N == 2:
+        # Linear in V/F once the denominators are cleared; no iteration needed
+        V_over_F = -(zs_k_minus_1[0] + zs_k_minus_1[1])/((zs[0] + zs[1])*K_minus_1[0]*K_minus_1[1])
+    else:
+        V_over_F_min = ((Kmax-Kmin)*z_of_Kmax - (1.-Kmin))/((1.-Kmin)*(Kmax-1.))
+        V_over_F_max = 1./(1.-Kmin)
+
+        V_over_F_min2 = max(0., V_over_F_min)
+        V_over_F_max2 = min(1., V_over_F_max)
+
+        def err(V_over_F):
+            tot = 0.0
+            for i in range(N):
+                tot += zs_k_minus_1[i]/(1.0 + V_over_F*K_minus_1[i])
+            return tot
+
+        # Start from a previous solution when one is given, e.g. by an outer loop
+        if guess is not None and V_over_F_min2 <= guess <= V_over_F_max2:
+            x0 = guess
+        else:
+            x0 = (V_over_F_min2 + V_over_F_max2)*0.5
+        V_over_F = None
+        if zs_nonnegative and Kmin < 1.0 < Kmax:
+            # With no negative compositions the error is monotone between
+            # these bounds, so the root can be kept bracketed
+            try:
+                V_over_F = Rachford_Rice_Halley(K_minus_1, zs_k_minus_1, x0,
+                                                low=V_over_F_min, high=V_over_F_max)
+            except (UnconvergedError, ZeroDivisionError, OverflowError):
+                V_over_F = None
+            if V_over_F is not None and not abs(err(V_over_F)) < 1e-9:
+                V_over_F = None
+        if V_over_F is None:
+            try:
+                V_over_F = Rachford_Rice_secant(K_minus_1, zs_k_minus_1, x0)
+            except (UnconvergedError, ZeroDivisionError, OverflowError):
+                V_over_F = None
+            # newton skips out of its specified range in some cases, finding another solution
+            # Check for that, and use brenth if it did
+            if V_over_F is None or not (V_over_F_min2 <= V_over_F <= V_over_F_max2):
+                try:
+                    V_over_F = brenth(err, V_over_F_max-1E-7, V_over_F_min+1E-7)
+                    brenth_error = None
+                except (NotBoundedError, UnconvergedError) as e:
+                    V_over_F, brenth_error = None, e
+                # With negative compositions the error can change sign across
+                # a pole, which brenth either fails on or converges to; Halley's
+                # method still finds the root in some of those cases
+                if V_over_F is None or not abs(err(V_over_F)) < 1e-9:
+                    try:
+                        V_halley = Rachford_Rice_Halley(K_minus_1, zs_k_minus_1, x0)
+                    except (UnconvergedError, ZeroDivisionError, OverflowError):
+                        V_halley = None
+                    if V_halley is not None and V_over_F_min2 <= V_halley <= V_over_F_max2:
+                        V_over_F = V_halley
+                    elif brenth_error is not None:
+                        raise brenth_error
+        # Cases not covered by the above solvers: When all components have K > 1, or all have K < 1
+        # Should get a solution for all other cases.
+    xs = [0.0]*N
+    ys = [0.0]*N
+    for i in range(N):
+        xs[i] = xi = zs[i]/(1.0 + V_over_F*K_minus_1[i])
+        ys[i] = Ks[i]*xi
     return V_over_F, xs, ys
 
 #from random import uniform, seed
@@ -252,6 +385,7 @@ class StabilityTester:
         self.cmps = range(self.N)
         self.aqueous_check = aqueous_check
         self.CASs = CASs
+        self.Wilson_TP_cached = None
 
         try:
             self.water_index = CASs.index(CAS_H2O)
@@ -335,12 +469,50 @@ class StabilityTester:
                        for k in self.cmps]
         return pure_guesses
 
+    def _Wilson_As(self):
+        # Only depends on the components; computed on first use, as testers
+        # which never use Wilson guesses need not have valid omegas
+        try:
+            return self.Wilson_As
+        except AttributeError:
+            pass
+        self.Wilson_As = [5.37*(1.0 + omega) for omega in self.omegas]
+        return self.Wilson_As
+
+    def _Wilson_Ks_and_log_Ks(self, T, P):
+        # Same as Wilson_K_value, with the omega term precomputed; ln(K) is
+        # kept as well as it stays finite where K underflows, and K**power is
+        # evaluated as exp(power*ln(K)) instead of with a pow call. The last
+        # result is kept as every guess at a given T and P starts from it;
+        # callers must not modify the returned lists.
+        if self.Wilson_TP_cached == (T, P):
+            return self.Wilson_Ks_cached, self.Wilson_log_Ks_cached
+        T_inv, P_inv = 1.0/T, 1.0/P
+        Tcs, Pcs, Wilson_As = self.Tcs, self.Pcs, self._Wilson_As()
+        Ks = [0.0]*self.N
+        log_Ks = [0.0]*self.N
+        for i in self.cmps:
+            Pr_inv = Pcs[i]*P_inv
+            x = Wilson_As[i]*(1.0 - Tcs[i]*T_inv)
+            Ks[i] = Pr_inv*exp(x)
+            log_Ks[i] = log(Pr_inv) + x
+        self.Wilson_TP_cached = (T, P)
+        self.Wilson_Ks_cached = Ks
+        self.Wilson_log_Ks_cached = log_Ks
+        return Ks, log_Ks
+
+    def Wilson_Ks(self, T, P):
+        return self._Wilson_Ks_and_log_Ks(T, P)[0]
+
+    def Wilson_log_Ks(self, T, P):
+        return self._Wilson_Ks_and_log_Ks(T, P)[1]
+
     def Wilson_guesses(self, T, P, zs, powers=(1, -1, 1/3., -1/3.)): #
         # First K is vapor-like phase; second, liquid like
-        Ks_Wilson = [Wilson_K_value(T=T, P=P, Tc=self.Tcs[i], Pc=self.Pcs[i], omega=self.omegas[i]) for i in self.cmps]
+        log_Ks_Wilson = self.Wilson_log_Ks(T, P)
         Wilson_guesses = []
         for power in powers:
-            Ys_Wilson = [Ki**power*zi for Ki, zi in zip(Ks_Wilson, zs)]
+            Ys_Wilson = [exp(power*log_Ki)*zi for log_Ki, zi in zip(log_Ks_Wilson, zs)]
             Wilson_guesses.append(normalize(Ys_Wilson))
 #            print(Ys_Wilson, normalize(Ys_Wilson))
         return Wilson_guesses
@@ -366,7 +538,7 @@ class StabilityTester:
 
     def incipient_guess_named(self, T, P, zs, name, zero_fraction=1E-6):
         N, cmps = self.N, self.cmps
-        Ks_Wilson = [Wilson_K_value(T=T, P=P, Tc=self.Tcs[i], Pc=self.Pcs[i], omega=self.omegas[i]) for i in self.cmps]
+        Ks_Wilson = self.Wilson_Ks(T, P)
         if name == 'Wilson gas':
             # Where the wilson guess leads to an incipient gas
             Ys_Wilson = [Ki*zi for Ki, zi in zip(Ks_Wilson, zs)]
@@ -375,10 +547,12 @@ class StabilityTester:
             Ys_Wilson = [zi/Ki for Ki, zi in zip(Ks_Wilson, zs)]
             return normalize(Ys_Wilson)
         elif name == 'Wilson gas third':
-            Ys_Wilson = [Ki**(1.0/3.0)*zi for Ki, zi in zip(Ks_Wilson, zs)]
+            log_Ks_Wilson = self.Wilson_log_Ks(T, P)
+            Ys_Wilson = [exp(log_Ki*(1.0/3.0))*zi for log_Ki, zi in zip(log_Ks_Wilson, zs)]
             return normalize(Ys_Wilson)
         elif name == 'Wilson liquid third':
-            Ys_Wilson = [Ki**(-1.0/3.0)*zi for Ki, zi in zip(Ks_Wilson, zs)]
+            log_Ks_Wilson = self.Wilson_log_Ks(T, P)
+            Ys_Wilson = [exp(log_Ki*(-1.0/3.0))*zi for log_Ki, zi in zip(log_Ks_Wilson, zs)]
             return normalize(Ys_Wilson)
         elif name[0:4] == 'pure':
             k = int(name[4:])
@@ -392,7 +566,6 @@ class StabilityTester:
                 zero_fraction=1E-6, expect_liquid=False, expect_aqueous=False,
                 existing_phases=0):
         N, cmps = self.N, self.cmps
-        Tcs, Pcs, omegas = self.Tcs, self.Pcs, self.omegas
 
         WILSON_MAX_GUESSES = 4
         PURE_MAX_GUESSES = N
@@ -405,13 +578,10 @@ class StabilityTester:
             RANDOM_MAX_GUESSES = random
 
         if Wilson:
-            Ks_Wilson = [0.0]*N
-            P_inv, T_inv = 1.0/P, 1.0/T
+            Ks_Wilson = self.Wilson_Ks(T, P)
             all_wilson_zero = True
             any_wilson_zero = False
             wilson_unlikely = True
-            for i in cmps:
-                Ks_Wilson[i] = Pcs[i]*P_inv*exp(5.37*(1.0 + omegas[i])*(1.0 - Tcs[i]*T_inv))
             for i in cmps:
                 if Ks_Wilson[i] != 0.0:
                     all_wilson_zero = False
@@ -419,6 +589,8 @@ class StabilityTester:
                     any_wilson_zero = True
                 if Ks_Wilson[i] > WILSON_UNLIKELY_K:
                     wilson_unlikely = False
+            # Cube roots are shared by the gas and liquid "third" guesses
+            Ks_Wilson_third = [exp(log_Ki*(1.0/3.0)) for log_Ki in self.Wilson_log_Ks(T, P)]
 
 
             if expect_liquid and not all_wilson_zero and not wilson_unlikely:
@@ -433,9 +605,9 @@ class StabilityTester:
 
                 if not any_wilson_zero:
                     yield normalize([zs[i]/Ks_Wilson[i] for i in cmps]) # liquid composition estimate
-                    yield normalize([Ks_Wilson[i]**(-1.0/3.0)*zs[i] for i in cmps])
+                    yield normalize([zs[i]/Ks_Wilson_third[i] for i in cmps])
 
-                yield normalize([Ks_Wilson[i]**(1.0/3.0)*zs[i] for i in cmps])
+                yield normalize([Ks_Wilson_third[i]*zs[i] for i in cmps])
                 yield normalize([Ks_Wilson[i]*zs[i] for i in cmps]) # gas composition estimate
 
             elif not all_wilson_zero and not wilson_unlikely:
@@ -444,10 +616,9 @@ class StabilityTester:
                     # yield zs
                 if not any_wilson_zero:
                     yield normalize([zs[i]/Ks_Wilson[i] for i in cmps]) # liquid composition estimate
-                # TODO optimization - can cache Ks_Wilson power, and cache it.
-                yield normalize([Ks_Wilson[i]**(1.0/3.0)*zs[i] for i in cmps])
+                yield normalize([Ks_Wilson_third[i]*zs[i] for i in cmps])
                 if not any_wilson_zero:
-                    yield normalize([Ks_Wilson[i]**(-1.0/3.0)*zs[i] for i in cmps])
+                    yield normalize([zs[i]/Ks_Wilson_third[i] for i in cmps])
 
         if pure: # these could be pre-allocated based on zero_fraction
             # A pure phase is more likely to be a liquid than a gas - gases have no polar effects
@@ -901,18 +1072,41 @@ class PropertyPackage:
 class Ideal(PropertyPackage):
     def Ks(self, T, P, zs=None):
         Psats = self._Psats(T)
-        Ks = [K_value(P=P, Psat=Psat) for Psat in Psats]
+        P_inv = 1.0/P
+        Ks = [Psat*P_inv for Psat in Psats]
         return Ks
 
 
     def _T_VF_err_ideal(self, P, VF, zs, Psats):
-        Ks = [K_value(P=P, Psat=Psat) for Psat in Psats]
-        return Rachford_Rice_solution_negative(zs=zs, Ks=Ks)[0] - VF
+        P_inv = 1.0/P
+        Ks = [Psat*P_inv for Psat in Psats]
+        return Rachford_Rice_solution_negative(zs=zs, Ks=Ks, guess=VF)[0] - VF
 
     def _P_VF_err_ideal(self, T, P, VF, zs):
         Psats = self._Psats(T)
-        Ks = [K_value(P=P, Psat=Psat) for Psat in Psats]
-        return Rachford_Rice_solution_negative(zs=zs, Ks=Ks)[0] - VF
+        P_inv = 1.0/P
+        Ks = [Psat*P_inv for Psat in Psats]
+        return Rachford_Rice_solution_negative(zs=zs, Ks=Ks, guess=VF)[0] - VF
+
+    def _P_bubble_err_ideal(self, T, log_P, zs):
+        # Log space keeps the residual finite and close to linear in 1/T
+        Psats = self._Psats(T)
+        dPsats_dT = self._d_Psats_dT(T)
+        P_bubble, dP_bubble_dT = 0.0, 0.0
+        for i in self.cmps:
+            P_bubble += zs[i]*Psats[i]
+            dP_bubble_dT += zs[i]*dPsats_dT[i]
+        return log(P_bubble) - log_P, dP_bubble_dT/P_bubble
+
+    def _P_dew_err_ideal(self, T, log_P, zs):
+        Psats = self._Psats(T)
+        dPsats_dT = self._d_Psats_dT(T)
+        P_dew_inv, dP_dew_inv_dT = 0.0, 0.0
+        for i in self.cmps:
+            x = zs[i]/Psats[i]
+            P_dew_inv += x
+            dP_dew_inv_dT -= x*dPsats_dT[i]/Psats[i]
+        return log_P + log(P_dew_inv), dP_dew_inv_dT/P_dew_inv
 
     def _Psats(self, T):
         # Need to reset the method because for the T bounded solver,
@@ -990,15 +1184,20 @@ class Ideal(PropertyPackage):
         if self.N == 1:
             Pdew = Pbubble = Psats[0]
         else:
-            Pdew = 1.0/sum([zs[i]/Psats[i] for i in range(self.N)])
-            Pbubble = sum([zs[i]*Psats[i] for i in range(self.N)])
+            # Bubble and dew pressures from one pass over the components
+            Pbubble, Pdew_inv = 0.0, 0.0
+            for i in self.cmps:
+                Pbubble += zs[i]*Psats[i]
+                Pdew_inv += zs[i]/Psats[i]
+            Pdew = 1.0/Pdew_inv
         if P <= Pdew:
             # phase, ys, xs, quality - works for 1 comps too
             return 'g', None, zs, 1
         elif P >= Pbubble:
             return 'l', zs, None, 0
         else:
-            Ks = [K_value(P=P, Psat=Psat) for Psat in Psats]
+            P_inv = 1.0/P
+            Ks = [Psat*P_inv for Psat in Psats]
             V_over_F, xs, ys = Rachford_Rice_solution_negative(zs=zs, Ks=Ks)
             return 'l/g', xs, ys, V_over_F
 
@@ -1019,9 +1218,22 @@ class Ideal(PropertyPackage):
             P = sum([zs[i]*Psats[i] for i in range(self.N)])
         elif VF == 1:
             P = 1.0/sum([zs[i]/Psats[i] for i in range(self.N)])
+        elif self.N == 2:
+            # Clearing the denominators of the binary Rachford-Rice equation
+            # leaves a quadratic in P with one positive root; no iteration
+            P0, P1 = Psats
+            a = VF - 1.0
+            b = zs[0]*P0 + zs[1]*P1 - VF*(P0 + P1)
+            c = VF*P0*P1
+            # Pick the form of the root that does not cancel
+            if b >= 0.0:
+                P = (-b - sqrt(b*b - 4.0*a*c))/(2.0*a)
+            else:
+                P = 2.0*c/(sqrt(b*b - 4.0*a*c) - b)
         else:
             P = brenth(self._T_VF_err_ideal, min(Psats)*(1+1E-7), max(Psats)*(1-1E-7), args=(VF, zs, Psats))
-        Ks = [K_value(P=P, Psat=Psat) for Psat in Psats]
+        P_inv = 1.0/P
+        Ks = [Psat*P_inv for Psat in Psats]
         V_over_F, xs, ys = Rachford_Rice_solution_negative(zs=zs, Ks=Ks)
         return 'l/g', xs, ys, V_over_F, P
 
@@ -1036,9 +1248,20 @@ class Ideal(PropertyPackage):
         elif 1.0 in zs:
             return 'l/g', list(zs), list(zs), VF, Tsats[zs.index(1.0)]
 
-        T = brenth(self._P_VF_err_ideal, min(Tsats)*(1+1E-7), max(Tsats)*(1-1E-7), args=(P, VF, zs))
+        T_low, T_high = min(Tsats)*(1+1E-7), max(Tsats)*(1-1E-7)
+        # Both residuals are monotonic in T, so a Newton step safeguarded by
+        # bisection inside the Tsat bracket always converges
+        if VF == 0:
+            T = newton(self._P_bubble_err_ideal, 0.5*(T_low + T_high), fprime=True,
+                       low=T_low, high=T_high, bisection=True, args=(log(P), zs))
+        elif VF == 1:
+            T = newton(self._P_dew_err_ideal, 0.5*(T_low + T_high), fprime=True,
+                       low=T_low, high=T_high, bisection=True, args=(log(P), zs))
+        else:
+            T = brenth(self._P_VF_err_ideal, T_low, T_high, args=(P, VF, zs))
         Psats = self._Psats(T)
-        Ks = [K_value(P=P, Psat=Psat) for Psat in Psats]
+        P_inv = 1.0/P
+        Ks = [Psat*P_inv for Psat in Psats]
         V_over_F, xs, ys = Rachford_Rice_solution_negative(zs=zs, Ks=Ks)
         return 'l/g', xs, ys, V_over_F, T
 
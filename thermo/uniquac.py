@@ -1937,25 +1937,36 @@ def UNIQUAC_gammas(xs, rs, qs, taus):
        the Uniquac Equation." Fluid Phase Equilibria 2, no. 2 (January 1,
        1978): 91-99. doi:10.1016/0378-3812(78)85002-X.
     '''
-    cmps = range(len(xs))
+    N = len(xs)
+    cmps = range(N)
 
-    rsxs = [rs[i]*xs[i] for i in cmps]
-    rsxs_sum_inv = 1.0/sum(rsxs)
-    phis = [rsxs[i]*rsxs_sum_inv for i in cmps]
-
-
-    qsxs = [qs[i]*xs[i] for i in cmps]
-    qsxs_sum_inv = 1.0/sum(qsxs)
-    vs = [qsxs[i]*qsxs_sum_inv for i in cmps]
-
-    Ss = [sum([vs[j]*taus[j][i] for j in cmps]) for i in cmps]
-    VsSs = [vs[j]/Ss[j] for j in cmps]
+    rsxs_sum, qsxs_sum = 0.0, 0.0
+    for i in cmps:
+        rsxs_sum += rs[i]*xs[i]
+        qsxs_sum += qs[i]*xs[i]
+    rsxs_sum_inv = 1.0/rsxs_sum
+    qsxs_sum_inv = 1.0/qsxs_sum
+    phis = [rs[i]*xs[i]*rsxs_sum_inv for i in cmps]
+    vs = [qs[i]*xs[i]*qsxs_sum_inv for i in cmps]
+
+    Ss = [0.0]*N
+    VsSs = [0.0]*N
+    for i in cmps:
+        tot = 0.0
+        for j in cmps:
+            tot += vs[j]*taus[j][i]
+        Ss[i] = tot
+        VsSs[i] = vs[i]/tot
 
     ans = []
     for i in cmps:
         x1 = phis[i]/xs[i]
         x2 = phis[i]/vs[i]
         loggammac = log(x1) + 1.0 - x1 - 5.0*qs[i]*(log(x2) + 1.0 - x2)
-        loggammar = qs[i]*(1.0 - log(Ss[i]) - sum([taus[i][j]*VsSs[j] for j in cmps]))
+        tauVsSs = 0.0
+        taus_i = taus[i]
+        for j in cmps:
+            tauVsSs += taus_i[j]*VsSs[j]
+        loggammar = qs[i]*(1.0 - log(Ss[i]) - tauVsSs)
         ans.append(exp(loggammac + loggammar))
     return ans
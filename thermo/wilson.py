@@ -57,6 +57,7 @@ from thermo.activity import GibbsExcess, d2interaction_exp_dT2, d3interaction_ex
 
 try:
     array, zeros, npsum, nplog, ones = np.array, np.zeros, np.sum, np.log, np.ones
+    npexp, dot = np.exp, np.dot
 except (ImportError, AttributeError):
     pass
 
@@ -1101,10 +1102,10 @@ class Wilson(GibbsExcess):
 
         if self.scalar:
             xj_Lambda_ijs = [0.0]*self.N
+            wilson_xj_Lambda_ijs(self.xs, lambdas, self.N, xj_Lambda_ijs)
         else:
-            xj_Lambda_ijs = zeros(self.N)
-
-        self._xj_Lambda_ijs = wilson_xj_Lambda_ijs(self.xs, lambdas, self.N, xj_Lambda_ijs)
+            xj_Lambda_ijs = dot(lambdas, self.xs)
+        self._xj_Lambda_ijs = xj_Lambda_ijs
         return xj_Lambda_ijs
 
     def xj_Lambda_ijs_inv(self):
@@ -1615,10 +1616,9 @@ class Wilson(GibbsExcess):
 
         if self.scalar:
             gammas = [0.0]*self.N
+            wilson_gammas(self.xs, self.N, lambdas, xj_Lambda_ijs_inv, gammas)
         else:
-            gammas = zeros(self.N)
-
-        wilson_gammas(self.xs, self.N, lambdas, xj_Lambda_ijs_inv, gammas)
+            gammas = npexp(1.0 - dot(self.xs*xj_Lambda_ijs_inv, lambdas))*xj_Lambda_ijs_inv
         self._gammas = gammas
         return gammas
 
@@ -1779,6 +1779,7 @@ def Wilson_gammas(xs, params):
         for j in cmps:
             tot2 += params[j][i]*xs[j]/sums0[j]
 
-        gamma = exp(1. - log(sums0[i]) - tot2)
+        # exp(1 - ln(sum) - tot2) without evaluating the logarithm
+        gamma = exp(1. - tot2)/sums0[i]
         gammas.append(gamma)
     return gammas